@@ -1,5 +1,7 @@
+import functools
+
 import pygame
-import math
+from math import sin, cos, radians, hypot
 '''
 todo:
 add left/right location 
@@ -21,11 +23,14 @@ WIDTH, HEIGHT = 800, 600
 ROCKET_SIZE = 20
 GROUND_HEIGHT = 50
 FPS = 60
+USE_BUSY_LOOP = False  # tick_busy_loop paces frames more precisely but spins a core
 
 # Physics constants
 GRAVITY = 0.03
 SPEED_THRESHOLD = 2  # Speed threshold for a successful landing (adjust as needed)
 ANGLE_THRESHOLD = 10  # Absolute angle threshold for a successful landing (adjust as needed)
+SPEED_THRESHOLD_SQ = SPEED_THRESHOLD * SPEED_THRESHOLD  # compare squared speeds to skip the sqrt
+GROUND_Y = HEIGHT - GROUND_HEIGHT - ROCKET_SIZE  # rocket_y at which the rocket touches the ground
 
 # Colors
 WHITE = (255, 255, 255)
@@ -40,15 +45,24 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Rocket Landing Simulator")
 font = pygame.font.Font(None, 36)
 
-# Rocket attributes
-rocket_x = WIDTH // 2
-rocket_y = 50
-rocket_angle = 0
-rocket_velocity_x = 0
-rocket_velocity_y = 0
-angular_velocity = 0
-fuel = 100
-fuel_rate = 0.5
+
+def step_physics(x, y, vx, vy, angle, angular_velocity):
+    # Integrate one frame of free-fall physics. Pure scalar in/out so the
+    # hot loop runs on locals (and the function could be jitted wholesale
+    # if a compiler like numba were ever added as a dependency)
+    vy += GRAVITY
+    # Wrap the angle into [-180, 180) so it can't grow without bound over
+    # long flights: radians/sin/cos stay on small arguments and the
+    # abs-angle landing check keeps meaning "close to upright"
+    angle = (angle + angular_velocity + 180.0) % 360.0 - 180.0
+    return x + vx, y + vy, vx, vy, angle
+
+
+@functools.lru_cache(maxsize=4096)
+def render_text(s):
+    # Font rasterization allocates a fresh Surface per call; values are
+    # rounded to 2 decimals so repeated frames usually hit the cache
+    return font.render(s, True, BLACK)
 
 # Define the rocket shape and size
 ROCKET_WIDTH = 20
@@ -58,86 +72,144 @@ ROCKET_HEIGHT = 40
 LEG_LENGTH = 10
 LEG_WIDTH = 41
 
-# Landing status
-landing_status = None  # None: in progress, "landed": successfully landed, "crashed": crashed
-
-# Main game loop
-running = True
-clock = pygame.time.Clock()
-
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_LEFT]:
-        rocket_angle += 1
-    if keys[pygame.K_RIGHT]:
-        rocket_angle -= 1
-    if keys[pygame.K_UP] and fuel > 0:
-        # Calculate the change in velocity based on rocket angle
-        angle_rad = math.radians(rocket_angle)
-        rocket_velocity_y += -0.1 * math.cos(angle_rad)
-        rocket_velocity_x += -0.1 * math.sin(angle_rad)
-        fuel -= fuel_rate
-
-    if landing_status is None:
-        # Apply gravity
-        rocket_velocity_y += GRAVITY
-
-        # Update rocket physics
-        rocket_x += rocket_velocity_x
-        rocket_y += rocket_velocity_y
-        rocket_angle += angular_velocity
-
-        # Check for collision with the ground
-        if rocket_y + ROCKET_SIZE >= HEIGHT - GROUND_HEIGHT:
-            if math.sqrt(rocket_velocity_y*rocket_velocity_y+rocket_velocity_x*rocket_velocity_x) > SPEED_THRESHOLD:
-                landing_status = "crashed (speed)"
-            elif abs(rocket_angle) > ANGLE_THRESHOLD:
-                landing_status = "crashed (angle)"
-            else:
-                landing_status = "landed!"
-
-        # Clear the screen
-        screen.fill(WHITE)
-
-        # Draw the ground
-        pygame.draw.rect(screen, GREEN, (0, HEIGHT - GROUND_HEIGHT, WIDTH, GROUND_HEIGHT))
-
-        # Rotate and draw the rocket
-        rocket_image = pygame.Surface((ROCKET_WIDTH, ROCKET_HEIGHT), pygame.SRCALPHA)
-        rocket_rect = rocket_image.get_rect()
-        rocket_image.fill(RED)
-        pygame.draw.polygon(rocket_image, ORANGE, [(ROCKET_WIDTH // 2, ROCKET_HEIGHT), (ROCKET_WIDTH // 2 - LEG_WIDTH // 2, ROCKET_HEIGHT + LEG_LENGTH), (ROCKET_WIDTH // 2 + LEG_WIDTH // 2, ROCKET_HEIGHT + LEG_LENGTH)])
-        rotated_rocket = pygame.transform.rotate(rocket_image, rocket_angle)
-        rotated_rect = rotated_rocket.get_rect(center=(rocket_x, rocket_y))
-        screen.blit(rotated_rocket, rotated_rect)
-
-        # draw the speed and angle on the top right corner
-        text = font.render(f"Speed: {round(math.sqrt(rocket_velocity_y*rocket_velocity_y+rocket_velocity_x*rocket_velocity_x), 2)} Angle: {round(rocket_angle, 2)} Fuel: {round(fuel)}", True, BLACK)
-        text_rect = text.get_rect(center=(WIDTH - 200, 50))
-        screen.blit(text, text_rect)
-
-    # Display landing status
-    else:
-        font = pygame.font.Font(None, 36)
-        text = font.render(landing_status.capitalize() + "!", True, BLACK)
-        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-        screen.blit(text, text_rect)
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_SPACE]:
-            landing_status = None
-            rocket_x = WIDTH // 2
-            rocket_y = 50
-            rocket_velocity_x = 0
-            rocket_velocity_y = 0
-            angular_velocity = 0
-            rocket_angle = 0
-            fuel = 100
-
-    pygame.display.flip()
-    clock.tick(FPS)
-
-pygame.quit()
+# Pre-rotate the rocket sprite once per whole degree so the main loop only
+# has to blit a cached Surface instead of rebuilding and rotating one per frame
+rocket_image = pygame.Surface((ROCKET_WIDTH, ROCKET_HEIGHT), pygame.SRCALPHA)
+rocket_image.fill(RED)
+pygame.draw.polygon(rocket_image, ORANGE, [(ROCKET_WIDTH // 2, ROCKET_HEIGHT), (ROCKET_WIDTH // 2 - LEG_WIDTH // 2, ROCKET_HEIGHT + LEG_LENGTH), (ROCKET_WIDTH // 2 + LEG_WIDTH // 2, ROCKET_HEIGHT + LEG_LENGTH)])
+ROCKET_SPRITES = {a: pygame.transform.rotate(rocket_image, a).convert_alpha() for a in range(360)}
+
+# Pre-render the static scene (sky + ground) so each frame restores the
+# backdrop with a single blit instead of a fill plus a rect draw
+background = pygame.Surface((WIDTH, HEIGHT))
+background.fill(WHITE)
+pygame.draw.rect(background, GREEN, (0, HEIGHT - GROUND_HEIGHT, WIDTH, GROUND_HEIGHT))
+background = background.convert()
+
+# Static HUD positions, hoisted so the loop doesn't rebuild the tuples each frame
+HUD_CENTER = (WIDTH - 200, 50)
+STATUS_CENTER = (WIDTH // 2, HEIGHT // 2)
+
+# Hoist key constants so the loop doesn't resolve them through the pygame module each frame
+K_LEFT, K_RIGHT, K_UP, K_SPACE = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE
+
+# Only queue the events the loop actually handles; mouse-motion spam
+# otherwise dominates the per-frame event poll
+pygame.event.set_blocked(None)
+pygame.event.set_allowed((pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP))
+
+
+# The whole per-frame step runs inside one function so every piece of hot
+# state is a type-stable local (LOAD_FAST on CPython, JIT-friendly under
+# PyPy). The loop is deliberately pure scalar Python with no NumPy, so
+# `pypy3 simulator.py` gets compiled-loop speeds with no extra dependencies.
+def main():
+    # Rocket attributes
+    rocket_x = WIDTH // 2
+    rocket_y = 50
+    rocket_angle = 0
+    rocket_velocity_x = 0
+    rocket_velocity_y = 0
+    angular_velocity = 0
+    fuel = 100
+    fuel_rate = 0.5
+
+    # Landing status
+    landing_status = None  # None: in progress, "landed": successfully landed, "crashed": crashed
+
+    # Main game loop
+    running = True
+    clock = pygame.time.Clock()
+
+    # Bind hot callables to plain names so each frame skips the attribute chains
+    event_get = pygame.event.get
+    get_pressed = pygame.key.get_pressed
+    screen_blit = screen.blit
+    display_update = pygame.display.update
+    clock_tick = clock.tick_busy_loop if USE_BUSY_LOOP else clock.tick
+
+    # Rects touched by the previous frame; seeded with the full screen so the
+    # first frame paints the whole background
+    prev_rects = [screen.get_rect()]
+
+    while running:
+        for event in event_get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        keys = get_pressed()
+
+        # landing_status doubles as the state flag: None while flying, a message
+        # once down. The dead branch only cares about K_SPACE, so the flight
+        # controls are skipped entirely after touchdown.
+        if landing_status is None:
+            if keys[K_LEFT]:
+                rocket_angle += 1
+            if keys[K_RIGHT]:
+                rocket_angle -= 1
+            if keys[K_UP] and fuel > 0:
+                # Calculate the change in velocity based on rocket angle
+                angle_rad = radians(rocket_angle)
+                rocket_velocity_y += -0.1 * cos(angle_rad)
+                rocket_velocity_x += -0.1 * sin(angle_rad)
+                fuel -= fuel_rate
+
+            # Apply gravity and update rocket physics
+            rocket_x, rocket_y, rocket_velocity_x, rocket_velocity_y, rocket_angle = step_physics(
+                rocket_x, rocket_y, rocket_velocity_x, rocket_velocity_y, rocket_angle, angular_velocity)
+
+            # Check for collision with the ground
+            if rocket_y >= GROUND_Y:
+                if rocket_velocity_y*rocket_velocity_y+rocket_velocity_x*rocket_velocity_x > SPEED_THRESHOLD_SQ:
+                    landing_status = "crashed (speed)"
+                elif abs(rocket_angle) > ANGLE_THRESHOLD:
+                    landing_status = "crashed (angle)"
+                else:
+                    landing_status = "landed!"
+
+            # Restore the pre-rendered backdrop only where last frame drew
+            for r in prev_rects:
+                screen_blit(background, r, r)
+
+            # Draw the nearest cached rotation of the rocket
+            rotated_rocket = ROCKET_SPRITES[int(rocket_angle) % 360]
+            rotated_rect = rotated_rocket.get_rect(center=(rocket_x, rocket_y))
+            screen_blit(rotated_rocket, rotated_rect)
+
+            # draw the speed and angle on the top right corner
+            text = render_text(f"Speed: {round(hypot(rocket_velocity_x, rocket_velocity_y), 2)} Angle: {round(rocket_angle, 2)} Fuel: {round(fuel)}")
+            text_rect = text.get_rect(center=HUD_CENTER)
+            screen_blit(text, text_rect)
+
+            # Push only the erased and freshly drawn regions to the display
+            dirty = prev_rects
+            dirty.append(rotated_rect)
+            dirty.append(text_rect)
+            prev_rects = [rotated_rect, text_rect]
+
+        # Display landing status
+        else:
+            text = render_text(landing_status.capitalize() + "!")
+            text_rect = text.get_rect(center=STATUS_CENTER)
+            screen_blit(text, text_rect)
+            dirty = [text_rect]
+            if keys[K_SPACE]:
+                # Next flight frame must also erase the status message
+                prev_rects.append(text_rect)
+                landing_status = None
+                rocket_x = WIDTH // 2
+                rocket_y = 50
+                rocket_velocity_x = 0
+                rocket_velocity_y = 0
+                angular_velocity = 0
+                rocket_angle = 0
+                fuel = 100
+
+        display_update(dirty)
+        clock_tick(FPS)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()